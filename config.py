@@ -1,6 +1,8 @@
 """프로젝트 설정 및 환경변수 로드."""
 
 import os
+from pathlib import Path
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,3 +12,11 @@ DEFAULT_MODEL = "gpt-4o-mini"
 TEMPERATURE = 0.2
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 5  # seconds
+RETRY_MAX_DELAY = 20  # seconds, 재시도 대기 상한
+MAX_CONCURRENCY = 8  # 동시 API 요청 수
+BATCH_POLL_INTERVAL = 30  # seconds, Batch API 상태 확인 간격
+
+# GPT 응답 캐시 디렉터리
+CACHE_DIR = Path(
+    os.getenv("WORD_TO_PY_CACHE_DIR", Path.home() / ".cache" / "word_to_py")
+)
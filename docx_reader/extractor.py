@@ -1,90 +1,151 @@
 """Word 문서(.docx)에서 텍스트와 수식을 추출한다.
 
 python-docx의 paragraph.text는 수식(<m:oMath>)을 누락하므로,
-lxml을 사용하여 <w:p> 요소를 직접 순회한다.
+.docx(zip) 안의 본문 XML을 lxml로 직접 파싱하여 <w:p> 요소를 순회한다.
 """
 
+import io
+import os
+import re
+import zipfile
 from pathlib import Path
 from lxml import etree
-from docx import Document
 
-from .omml_parser import omml_to_latex
+from .omml_parser import _qname, omml_to_latex
 
 # 네임스페이스
 WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 MATH_NS = "http://schemas.openxmlformats.org/officeDocument/2006/math"
 
-W_P = f"{{{WORD_NS}}}p"       # <w:p> 문단
-W_R = f"{{{WORD_NS}}}r"       # <w:r> 런
-W_T = f"{{{WORD_NS}}}t"       # <w:t> 텍스트
-W_TBL = f"{{{WORD_NS}}}tbl"   # <w:tbl> 테이블
-W_TR = f"{{{WORD_NS}}}tr"     # <w:tr> 테이블 행
-W_TC = f"{{{WORD_NS}}}tc"     # <w:tc> 테이블 셀
-W_BR = f"{{{WORD_NS}}}br"     # <w:br> 줄바꿈
-W_TAB = f"{{{WORD_NS}}}tab"   # <w:tab> 탭
-M_OMATH = f"{{{MATH_NS}}}oMath"        # 인라인 수식
-M_OMATHPARA = f"{{{MATH_NS}}}oMathPara" # 디스플레이 수식
+# 패키지 관계(_rels/.rels)에서 본문 파트를 가리키는 관계 유형
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+RT_OFFICE_DOCUMENT = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+DEFAULT_DOCUMENT_PART = "word/document.xml"
+
+W_BODY = _qname(WORD_NS, "body") # <w:body> 본문
+W_P = _qname(WORD_NS, "p")       # <w:p> 문단
+W_R = _qname(WORD_NS, "r")       # <w:r> 런
+W_T = _qname(WORD_NS, "t")       # <w:t> 텍스트
+W_TBL = _qname(WORD_NS, "tbl")   # <w:tbl> 테이블
+W_TR = _qname(WORD_NS, "tr")     # <w:tr> 테이블 행
+W_TC = _qname(WORD_NS, "tc")     # <w:tc> 테이블 셀
+W_BR = _qname(WORD_NS, "br")     # <w:br> 줄바꿈
+W_TAB = _qname(WORD_NS, "tab")   # <w:tab> 탭
+M_OMATH = _qname(MATH_NS, "oMath")        # 인라인 수식
+M_OMATHPARA = _qname(MATH_NS, "oMathPara") # 디스플레이 수식
+
+NSMAP = {"w": WORD_NS, "m": MATH_NS}
+
+# 미리 컴파일한 XPath (결과는 문서 순서로 반환됨)
+_BODY_XPATH = etree.XPath("./w:p | ./w:tbl", namespaces=NSMAP)
+_PARA_XPATH = etree.XPath("./w:r | ./m:oMath | ./m:oMathPara", namespaces=NSMAP)
+_OMATH_XPATH = etree.XPath(".//m:oMath", namespaces=NSMAP)
+_REL_XPATH = etree.XPath("./r:Relationship", namespaces={"r": REL_NS})
+
+# 3줄 이상 연속된 줄바꿈
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+# python-docx와 동일한 파서 설정 (외부 엔티티 미해석)
+_XML_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+
+def _document_part_name(zf: zipfile.ZipFile) -> str:
+    """패키지 관계에서 본문 파트(보통 word/document.xml)의 경로를 찾는다."""
+    try:
+        with zf.open("_rels/.rels") as f:
+            rels = etree.parse(f, _XML_PARSER).getroot()
+    except KeyError:
+        return DEFAULT_DOCUMENT_PART
+
+    for rel in _REL_XPATH(rels):
+        if rel.get("Type") == RT_OFFICE_DOCUMENT and rel.get("TargetMode") != "External":
+            return rel.get("Target", DEFAULT_DOCUMENT_PART).lstrip("/")
+    return DEFAULT_DOCUMENT_PART
+
+
+def _load_body(path: Path):
+    """.docx 파일에서 본문 XML을 파싱하여 <w:body> 요소를 반환한다.
+
+    python-docx Document 객체를 만들지 않고 zip에서 본문 파트만 읽는다.
+    """
+    try:
+        with zipfile.ZipFile(path) as zf:
+            with zf.open(_document_part_name(zf)) as f:
+                root = etree.parse(f, _XML_PARSER).getroot()
+    except etree.XMLSyntaxError as e:
+        # XMLSyntaxError는 pickle할 수 없어 프로세스 풀에서 원래 메시지가 사라지므로
+        # 메시지를 담은 ValueError로 바꾼다
+        raise ValueError(f"문서 XML을 해석할 수 없습니다: {e}") from e
+
+    body = root.find(W_BODY)
+    if body is None:
+        raise ValueError(f"문서 본문(<w:body>)을 찾을 수 없습니다: {path}")
+    return body
 
 
 def _extract_run_text(run_elem) -> str:
     """<w:r> 요소에서 텍스트를 추출한다."""
     parts = []
     for child in run_elem:
-        if child.tag == W_T:
+        tag = child.tag
+        if tag == W_T:
             parts.append(child.text or "")
-        elif child.tag == W_BR:
+        elif tag == W_BR:
             parts.append("\n")
-        elif child.tag == W_TAB:
+        elif tag == W_TAB:
             parts.append("\t")
     return "".join(parts)
 
 
-def _process_paragraph(para_elem) -> str:
-    """<w:p> 요소를 처리하여 텍스트+LaTeX 수식 문자열을 반환한다."""
-    parts = []
+def _inline_math(omath_elem) -> str:
+    """<m:oMath> 인라인 수식을 $...$ 로 변환한다."""
+    latex = omml_to_latex(omath_elem)
+    return f" ${latex}$ " if latex else ""
 
-    for child in para_elem:
-        tag = child.tag
 
-        if tag == W_R:
-            # 일반 텍스트 런
-            parts.append(_extract_run_text(child))
-
-        elif tag == M_OMATH:
-            # 인라인 수식
-            latex = omml_to_latex(child)
-            if latex:
-                parts.append(f" ${latex}$ ")
-
-        elif tag == M_OMATHPARA:
-            # 디스플레이 수식 (블록 수식)
-            # m:oMathPara 안에 m:oMath가 있음
-            omath_elems = child.findall(f".//{M_OMATH}")
-            for omath in omath_elems:
-                latex = omml_to_latex(omath)
-                if latex:
-                    parts.append(f"\n$${latex}$$\n")
+def _block_math(omath_para_elem) -> str:
+    """<m:oMathPara> 디스플레이 수식을 $$...$$ 로 변환한다.
 
+    m:oMathPara 안에 m:oMath가 있음
+    """
+    parts = []
+    for omath in _OMATH_XPATH(omath_para_elem):
+        latex = omml_to_latex(omath)
+        if latex:
+            parts.append(f"\n$${latex}$$\n")
     return "".join(parts)
 
 
+# 문단 자식 태그별 처리 함수 (일반 텍스트 런 / 인라인 수식 / 블록 수식)
+_PARA_HANDLERS = {
+    W_R: _extract_run_text,
+    M_OMATH: _inline_math,
+    M_OMATHPARA: _block_math,
+}
+
+
+def _process_paragraph(para_elem) -> str:
+    """<w:p> 요소를 처리하여 텍스트+LaTeX 수식 문자열을 반환한다."""
+    # _PARA_XPATH는 _PARA_HANDLERS에 등록된 태그만 반환한다
+    return "".join(
+        _PARA_HANDLERS[child.tag](child) for child in _PARA_XPATH(para_elem)
+    )
+
+
 def _process_table(tbl_elem) -> str:
     """<w:tbl> 요소를 처리하여 마크다운 테이블 문자열을 반환한다."""
     rows = []
-    for tr in tbl_elem:
-        if tr.tag != W_TR:
-            continue
+    for tr in tbl_elem.iterchildren(W_TR):
         cells = []
-        for tc in tr:
-            if tc.tag != W_TC:
-                continue
+        for tc in tr.iterchildren(W_TC):
             # 셀 안의 모든 문단 처리
             cell_parts = []
-            for para in tc:
-                if para.tag == W_P:
-                    text = _process_paragraph(para).strip()
-                    if text:
-                        cell_parts.append(text)
+            for para in tc.iterchildren(W_P):
+                text = _process_paragraph(para).strip()
+                if text:
+                    cell_parts.append(text)
             cells.append(" ".join(cell_parts))
         if cells:
             rows.append(cells)
@@ -107,7 +168,7 @@ def _process_table(tbl_elem) -> str:
     return "\n".join(lines)
 
 
-def extract_document(docx_path: str) -> str:
+def extract_document(docx_path: str | os.PathLike) -> str:
     """Word 문서에서 전체 텍스트를 추출한다.
 
     수식은 LaTeX로 변환되어 $...$ 또는 $$...$$ 안에 포함된다.
@@ -125,28 +186,30 @@ def extract_document(docx_path: str) -> str:
     if not path.suffix.lower() == ".docx":
         raise ValueError(f"지원하지 않는 파일 형식입니다: {path.suffix}")
 
-    doc = Document(str(path))
-    body = doc.element.body
+    body = _load_body(path)
 
-    paragraphs = []
+    # 문단마다 줄바꿈을 붙여 하나의 버퍼에 바로 기록한다
+    # (끝에 남는 줄바꿈은 마지막 strip()에서 제거됨)
+    buf = io.StringIO()
 
-    for elem in body:
+    for elem in _BODY_XPATH(body):
         tag = elem.tag
 
         if tag == W_P:
-            text = _process_paragraph(elem)
-            paragraphs.append(text)
+            buf.write(_process_paragraph(elem))
+            buf.write("\n")
 
         elif tag == W_TBL:
             table_md = _process_table(elem)
             if table_md:
-                paragraphs.append("\n" + table_md + "\n")
+                buf.write("\n")
+                buf.write(table_md)
+                buf.write("\n\n")
 
     # 연속된 빈 줄을 최대 2줄로 제한
-    result = "\n".join(paragraphs)
+    result = buf.getvalue()
     # Word의 non-breaking space(\xa0)를 일반 공백으로 치환
     result = result.replace("\xa0", " ")
-    while "\n\n\n" in result:
-        result = result.replace("\n\n\n", "\n\n")
+    result = _MULTI_NEWLINE_RE.sub("\n\n", result)
 
     return result.strip()
@@ -4,6 +4,8 @@ Word 2016 수식 편집기로 작성된 수식(<m:oMath>)을 LaTeX 문자열로
 python-docx의 paragraph.text는 수식을 누락하므로 lxml로 직접 XML을 파싱한다.
 """
 
+import sys
+
 from lxml import etree
 
 # OMML 네임스페이스
@@ -15,6 +17,67 @@ NSMAP = {
     "w": WORD_NS,
 }
 
+
+def _qname(ns: str, local: str) -> str:
+    """Clark 표기 태그 이름('{uri}local')을 만든다.
+
+    etree.QName으로 이름을 검증하고, 모든 비교/검색에서 같은 문자열 객체를
+    쓰도록 intern한다.
+    """
+    return sys.intern(etree.QName(ns, local).text)
+
+
+# 태그 이름 (Clark 표기, 모듈 로드 시 한 번만 생성)
+# 수식 구조 요소
+M_F = _qname(MATH_NS, "f")                     # <m:f> 분수
+M_SSUP = _qname(MATH_NS, "sSup")               # <m:sSup> 위첨자
+M_SSUB = _qname(MATH_NS, "sSub")               # <m:sSub> 아래첨자
+M_SSUBSUP = _qname(MATH_NS, "sSubSup")         # <m:sSubSup> 아래+위첨자
+M_RAD = _qname(MATH_NS, "rad")                 # <m:rad> 근호
+M_NARY = _qname(MATH_NS, "nary")               # <m:nary> N-항 연산자
+M_D = _qname(MATH_NS, "d")                     # <m:d> 구분자/괄호
+M_FUNC = _qname(MATH_NS, "func")               # <m:func> 함수
+M_ACC = _qname(MATH_NS, "acc")                 # <m:acc> 악센트
+M_BAR = _qname(MATH_NS, "bar")                 # <m:bar> 윗줄/밑줄
+M_M = _qname(MATH_NS, "m")                     # <m:m> 행렬
+M_MR = _qname(MATH_NS, "mr")                   # <m:mr> 행렬 행
+M_EQARR = _qname(MATH_NS, "eqArr")             # <m:eqArr> 수식 배열
+M_LIMLOW = _qname(MATH_NS, "limLow")           # <m:limLow> 하한
+M_LIMUPP = _qname(MATH_NS, "limUpp")           # <m:limUpp> 상한
+M_GROUPCHR = _qname(MATH_NS, "groupChr")       # <m:groupChr> 그룹 문자
+M_BORDERBOX = _qname(MATH_NS, "borderBox")     # <m:borderBox> 테두리 박스
+M_BOX = _qname(MATH_NS, "box")                 # <m:box> 박스
+M_SPRE = _qname(MATH_NS, "sPre")               # <m:sPre> 전치 첨자
+M_R = _qname(MATH_NS, "r")                     # <m:r> 수식 런
+M_T = _qname(MATH_NS, "t")                     # <m:t> 수식 텍스트
+# 인자 요소
+M_E = _qname(MATH_NS, "e")                     # <m:e> 기본 요소
+M_NUM = _qname(MATH_NS, "num")                 # <m:num> 분자
+M_DEN = _qname(MATH_NS, "den")                 # <m:den> 분모
+M_SUB = _qname(MATH_NS, "sub")                 # <m:sub> 아래첨자 인자
+M_SUP = _qname(MATH_NS, "sup")                 # <m:sup> 위첨자 인자
+M_DEG = _qname(MATH_NS, "deg")                 # <m:deg> 근호 차수
+M_LIM = _qname(MATH_NS, "lim")                 # <m:lim> 극한 인자
+M_FNAME = _qname(MATH_NS, "fName")             # <m:fName> 함수명
+# 속성 요소
+M_FPR = _qname(MATH_NS, "fPr")
+M_RADPR = _qname(MATH_NS, "radPr")
+M_DEGHIDE = _qname(MATH_NS, "degHide")
+M_NARYPR = _qname(MATH_NS, "naryPr")
+M_LIMLOC = _qname(MATH_NS, "limLoc")
+M_DPR = _qname(MATH_NS, "dPr")
+M_BEGCHR = _qname(MATH_NS, "begChr")
+M_ENDCHR = _qname(MATH_NS, "endChr")
+M_SEPCHR = _qname(MATH_NS, "sepChr")
+M_ACCPR = _qname(MATH_NS, "accPr")
+M_BARPR = _qname(MATH_NS, "barPr")
+M_GROUPCHRPR = _qname(MATH_NS, "groupChrPr")
+M_CHR = _qname(MATH_NS, "chr")
+M_POS = _qname(MATH_NS, "pos")
+M_TYPE = _qname(MATH_NS, "type")
+M_VAL = _qname(MATH_NS, "val")                 # m:val 속성
+W_T = _qname(WORD_NS, "t")                     # <w:t> 텍스트
+
 # 유니코드 → LaTeX 심볼 매핑
 UNICODE_TO_LATEX = {
     # 그리스 소문자
@@ -137,45 +200,49 @@ ACCENT_MAP = {
     "\u23df": r"\underbrace",
 }
 
+# 구분자(괄호) 문자 → LaTeX 매핑
+BRACE_MAP = {
+    "{": r"\{",
+    "}": r"\}",
+    "": ".",  # 빈 구분자
+    "|": "|",
+    "‖": r"\|",
+    "⌈": r"\lceil",
+    "⌉": r"\rceil",
+    "⌊": r"\lfloor",
+    "⌋": r"\rfloor",
+    "⟨": r"\langle",
+    "⟩": r"\rangle",
+}
 
-def _qn(tag: str) -> str:
-    """네임스페이스 약칭을 전체 URI로 확장한다. 예: 'm:f' → '{uri}f'."""
-    prefix, local = tag.split(":")
-    return f"{{{NSMAP[prefix]}}}{local}"
-
-
-def _find(elem, tag: str):
-    """elem 하위에서 tag에 해당하는 첫 번째 자식을 찾는다."""
-    return elem.find(_qn(tag))
-
+# LaTeX에 명령으로 존재하는 함수명 (\sin, \log 등)
+KNOWN_FUNCS = frozenset({
+    "sin", "cos", "tan", "cot", "sec", "csc",
+    "arcsin", "arccos", "arctan",
+    "sinh", "cosh", "tanh",
+    "log", "ln", "exp", "lim", "max", "min",
+    "sup", "inf", "det", "dim", "gcd",
+})
 
-def _findall(elem, tag: str):
-    """elem 하위에서 tag에 해당하는 모든 자식을 찾는다."""
-    return elem.findall(_qn(tag))
+# str.translate용 변환 테이블
+# 명령어(backslash로 시작) 뒤에는 공백을 붙여 다음 문자와 분리한다.
+_LATEX_TRANSLATE = str.maketrans({
+    ch: latex + " " if latex.startswith("\\") else latex
+    for ch, latex in UNICODE_TO_LATEX.items()
+})
 
 
 def _get_val(elem, tag: str) -> str:
     """m:xxxPr 내의 m:val 속성 값을 가져온다."""
-    child = _find(elem, tag)
+    child = elem.find(tag)
     if child is not None:
-        return child.get(_qn("m:val"), "")
+        return child.get(M_VAL, "")
     return ""
 
 
 def _escape_latex(text: str) -> str:
     """유니코드 문자를 LaTeX 심볼로 변환한다."""
-    result = []
-    for ch in text:
-        if ch in UNICODE_TO_LATEX:
-            latex = UNICODE_TO_LATEX[ch]
-            # 명령어 뒤에 공백 추가 (backslash로 시작하는 경우)
-            if latex.startswith("\\") and not latex.startswith("^"):
-                result.append(latex + " ")
-            else:
-                result.append(latex)
-        else:
-            result.append(ch)
-    return "".join(result)
+    return text.translate(_LATEX_TRANSLATE)
 
 
 class OMMLToLatex:
@@ -186,387 +253,377 @@ class OMMLToLatex:
         latex_str = converter.convert(omath_element)
     """
 
-    def __init__(self):
-        # 태그별 핸들러 매핑
-        self._handlers = {
-            _qn("m:f"): self._handle_frac,
-            _qn("m:sSup"): self._handle_ssup,
-            _qn("m:sSub"): self._handle_ssub,
-            _qn("m:sSubSup"): self._handle_ssubsup,
-            _qn("m:rad"): self._handle_rad,
-            _qn("m:nary"): self._handle_nary,
-            _qn("m:d"): self._handle_delim,
-            _qn("m:func"): self._handle_func,
-            _qn("m:acc"): self._handle_acc,
-            _qn("m:bar"): self._handle_bar,
-            _qn("m:m"): self._handle_matrix,
-            _qn("m:eqArr"): self._handle_eqarr,
-            _qn("m:limLow"): self._handle_limlow,
-            _qn("m:limUpp"): self._handle_limupp,
-            _qn("m:groupChr"): self._handle_groupchr,
-            _qn("m:borderBox"): self._handle_borderbox,
-            _qn("m:box"): self._handle_box,
-            _qn("m:sPre"): self._handle_spre,
-            _qn("m:r"): self._handle_run,
-        }
-
     def convert(self, elem) -> str:
         """OMML 요소 트리를 LaTeX 문자열로 변환한다."""
         if elem is None:
             return ""
-        return self._process(elem).strip()
-
-    def _process(self, elem) -> str:
-        """요소를 재귀적으로 처리한다."""
-        tag = elem.tag
+        # 모든 핸들러가 하나의 리스트에 조각을 추가하고, 마지막에 한 번만 결합한다
+        out = []
+        self._emit(elem, out)
+        return "".join(out).strip()
 
+    def _emit(self, elem, out: list) -> None:
+        """요소를 처리하여 결과 조각을 out에 추가한다."""
         # 등록된 핸들러가 있으면 사용
-        handler = self._handlers.get(tag)
+        handler = self._HANDLERS.get(elem.tag)
         if handler:
-            return handler(elem)
+            handler(self, elem, out)
+            return
 
         # 핸들러가 없으면 자식들을 순서대로 처리
-        parts = []
-        for child in elem:
-            parts.append(self._process(child))
-        return "".join(parts)
+        self._emit_children(elem, out)
+
+    def _emit_children(self, elem, out: list) -> None:
+        """elem의 모든 자식을 순서대로 처리하여 out에 추가한다.
+
+        핸들러가 없는 중간 요소는 재귀 호출 대신 iterwalk로 순회하고,
+        핸들러가 있는 요소는 핸들러에 맡긴 뒤 하위 트리를 건너뛴다.
+        elem이 None이면 아무것도 추가하지 않는다.
+        """
+        if elem is None:
+            return
+        handlers = self._HANDLERS
+        walker = etree.iterwalk(elem, events=("start",))
+        next(walker)  # 루트(elem) 자신은 핸들러 없이 자식만 처리
+
+        for _, el in walker:
+            handler = handlers.get(el.tag)
+            if handler:
+                handler(self, el, out)
+                walker.skip_subtree()
 
     def _process_children(self, elem) -> str:
-        """elem의 모든 자식을 처리하여 결합한다."""
-        parts = []
-        for child in elem:
-            parts.append(self._process(child))
-        return "".join(parts)
-
-    def _get_element_text(self, elem) -> str:
-        """m:e (요소) 내용을 처리한다."""
-        e = _find(elem, "m:e")
-        if e is not None:
-            return self._process_children(e)
-        return ""
+        """elem의 모든 자식을 처리한 결과를 문자열로 반환한다.
+
+        결과를 검사하거나 다듬어야 하는 경우(strip, 빈 값 확인 등)에만 사용한다.
+        """
+        out = []
+        self._emit_children(elem, out)
+        return "".join(out)
 
     # ── 핸들러들 ──────────────────────────────────────────────
+    # 모든 핸들러는 결과 조각을 out에 추가한다.
 
-    def _handle_run(self, elem) -> str:
+    def _handle_run(self, elem, out: list) -> None:
         """m:r (수식 런) - 텍스트 추출."""
-        t = _find(elem, "m:t")
+        t = elem.find(M_T)
         if t is not None and t.text:
-            return _escape_latex(t.text)
+            out.append(_escape_latex(t.text))
+            return
         # w:t 안에 있을 수도 있음
-        wt = _find(elem, "w:t")
+        wt = elem.find(W_T)
         if wt is not None and wt.text:
-            return _escape_latex(wt.text)
-        return ""
+            out.append(_escape_latex(wt.text))
 
-    def _handle_frac(self, elem) -> str:
+    def _handle_frac(self, elem, out: list) -> None:
         """m:f (분수) → \\frac{num}{den}."""
         # 분수 유형 확인
-        fpr = _find(elem, "m:fPr")
+        fpr = elem.find(M_FPR)
         frac_type = ""
         if fpr is not None:
-            frac_type = _get_val(fpr, "m:type")
+            frac_type = _get_val(fpr, M_TYPE)
 
-        num_elem = _find(elem, "m:num")
-        den_elem = _find(elem, "m:den")
-        num = self._process_children(num_elem) if num_elem is not None else ""
-        den = self._process_children(den_elem) if den_elem is not None else ""
+        num_elem = elem.find(M_NUM)
+        den_elem = elem.find(M_DEN)
 
         if frac_type == "lin":
             # 인라인 분수: a/b
-            return f"{num}/{den}"
-        return rf"\frac{{{num}}}{{{den}}}"
-
-    def _handle_ssup(self, elem) -> str:
+            self._emit_children(num_elem, out)
+            out.append("/")
+            self._emit_children(den_elem, out)
+            return
+
+        out.append(r"\frac{")
+        self._emit_children(num_elem, out)
+        out.append("}{")
+        self._emit_children(den_elem, out)
+        out.append("}")
+
+    def _handle_ssup(self, elem, out: list) -> None:
         """m:sSup (위첨자) → base^{sup}."""
-        e = _find(elem, "m:e")
-        sup = _find(elem, "m:sup")
-        base = self._process_children(e) if e is not None else ""
-        sup_text = self._process_children(sup) if sup is not None else ""
-        return f"{base}^{{{sup_text}}}"
+        self._emit_children(elem.find(M_E), out)
+        out.append("^{")
+        self._emit_children(elem.find(M_SUP), out)
+        out.append("}")
 
-    def _handle_ssub(self, elem) -> str:
+    def _handle_ssub(self, elem, out: list) -> None:
         """m:sSub (아래첨자) → base_{sub}."""
-        e = _find(elem, "m:e")
-        sub = _find(elem, "m:sub")
-        base = self._process_children(e) if e is not None else ""
-        sub_text = self._process_children(sub) if sub is not None else ""
-        return f"{base}_{{{sub_text}}}"
+        self._emit_children(elem.find(M_E), out)
+        out.append("_{")
+        self._emit_children(elem.find(M_SUB), out)
+        out.append("}")
 
-    def _handle_ssubsup(self, elem) -> str:
+    def _handle_ssubsup(self, elem, out: list) -> None:
         """m:sSubSup (아래+위첨자) → base_{sub}^{sup}."""
-        e = _find(elem, "m:e")
-        sub = _find(elem, "m:sub")
-        sup = _find(elem, "m:sup")
-        base = self._process_children(e) if e is not None else ""
-        sub_text = self._process_children(sub) if sub is not None else ""
-        sup_text = self._process_children(sup) if sup is not None else ""
-        return f"{base}_{{{sub_text}}}^{{{sup_text}}}"
-
-    def _handle_rad(self, elem) -> str:
+        self._emit_children(elem.find(M_E), out)
+        out.append("_{")
+        self._emit_children(elem.find(M_SUB), out)
+        out.append("}^{")
+        self._emit_children(elem.find(M_SUP), out)
+        out.append("}")
+
+    def _handle_rad(self, elem, out: list) -> None:
         """m:rad (근호) → \\sqrt{e} 또는 \\sqrt[deg]{e}."""
         # 차수 확인
-        rad_pr = _find(elem, "m:radPr")
+        rad_pr = elem.find(M_RADPR)
         deg_hide = False
         if rad_pr is not None:
-            dh = _find(rad_pr, "m:degHide")
+            dh = rad_pr.find(M_DEGHIDE)
             if dh is not None:
-                deg_hide = dh.get(_qn("m:val"), "") == "1"
-
-        deg = _find(elem, "m:deg")
-        e = _find(elem, "m:e")
-        content = self._process_children(e) if e is not None else ""
+                deg_hide = dh.get(M_VAL, "") == "1"
 
+        deg = elem.find(M_DEG)
+        deg_text = ""
         if deg is not None and not deg_hide:
             deg_text = self._process_children(deg).strip()
-            if deg_text:
-                return rf"\sqrt[{deg_text}]{{{content}}}"
 
-        return rf"\sqrt{{{content}}}"
+        if deg_text:
+            out.append(rf"\sqrt[{deg_text}]{{")
+        else:
+            out.append(r"\sqrt{")
+        self._emit_children(elem.find(M_E), out)
+        out.append("}")
 
-    def _handle_nary(self, elem) -> str:
+    def _handle_nary(self, elem, out: list) -> None:
         """m:nary (N-항 연산자: 합, 적분 등) → \\sum_{sub}^{sup} e."""
-        nary_pr = _find(elem, "m:naryPr")
+        nary_pr = elem.find(M_NARYPR)
 
         # 연산자 문자 확인
         op_char = "\u2211"  # 기본값: 합
         if nary_pr is not None:
-            chr_elem = _find(nary_pr, "m:chr")
+            chr_elem = nary_pr.find(M_CHR)
             if chr_elem is not None:
-                op_char = chr_elem.get(_qn("m:val"), op_char)
+                op_char = chr_elem.get(M_VAL, op_char)
 
         latex_op = NARY_MAP.get(op_char, r"\sum")
 
         # 상한/하한 위치 확인
         lim_loc = ""
         if nary_pr is not None:
-            lim_loc = _get_val(nary_pr, "m:limLoc")
+            lim_loc = _get_val(nary_pr, M_LIMLOC)
 
-        sub = _find(elem, "m:sub")
-        sup = _find(elem, "m:sup")
-        e = _find(elem, "m:e")
+        sub = elem.find(M_SUB)
+        sup = elem.find(M_SUP)
 
         sub_text = self._process_children(sub).strip() if sub is not None else ""
         sup_text = self._process_children(sup).strip() if sup is not None else ""
-        content = self._process_children(e) if e is not None else ""
 
-        result = latex_op
+        out.append(latex_op)
         if sub_text:
-            result += f"_{{{sub_text}}}"
+            out.append(f"_{{{sub_text}}}")
         if sup_text:
-            result += f"^{{{sup_text}}}"
-        result += f" {content}"
+            out.append(f"^{{{sup_text}}}")
+        out.append(" ")
+        self._emit_children(elem.find(M_E), out)
 
-        return result
-
-    def _handle_delim(self, elem) -> str:
+    def _handle_delim(self, elem, out: list) -> None:
         """m:d (구분자/괄호) → \\left( ... \\right)."""
-        d_pr = _find(elem, "m:dPr")
+        d_pr = elem.find(M_DPR)
         beg_chr = "("
         end_chr = ")"
         sep_chr = "|"
 
         if d_pr is not None:
-            bc = _find(d_pr, "m:begChr")
+            bc = d_pr.find(M_BEGCHR)
             if bc is not None:
-                beg_chr = bc.get(_qn("m:val"), "(")
-            ec = _find(d_pr, "m:endChr")
+                beg_chr = bc.get(M_VAL, "(")
+            ec = d_pr.find(M_ENDCHR)
             if ec is not None:
-                end_chr = ec.get(_qn("m:val"), ")")
-            sc = _find(d_pr, "m:sepChr")
+                end_chr = ec.get(M_VAL, ")")
+            sc = d_pr.find(M_SEPCHR)
             if sc is not None:
-                sep_chr = sc.get(_qn("m:val"), "|")
-
-        # 특수 괄호 매핑
-        brace_map = {
-            "{": r"\{",
-            "}": r"\}",
-            "": ".",  # 빈 구분자
-            "|": "|",
-            "‖": r"\|",
-            "⌈": r"\lceil",
-            "⌉": r"\rceil",
-            "⌊": r"\lfloor",
-            "⌋": r"\rfloor",
-            "⟨": r"\langle",
-            "⟩": r"\rangle",
-        }
-
-        left = brace_map.get(beg_chr, beg_chr)
-        right = brace_map.get(end_chr, end_chr)
-
-        # m:e 요소들 처리
-        elements = _findall(elem, "m:e")
-        parts = []
-        for e in elements:
-            parts.append(self._process_children(e))
-
-        sep = f" {sep_chr} " if len(parts) > 1 else ""
-        inner = sep.join(parts)
-
-        return rf"\left{left} {inner} \right{right}"
-
-    def _handle_func(self, elem) -> str:
+                sep_chr = sc.get(M_VAL, "|")
+
+        left = BRACE_MAP.get(beg_chr, beg_chr)
+        right = BRACE_MAP.get(end_chr, end_chr)
+
+        # m:e 요소들 처리 (2개 이상이면 구분 문자로 연결)
+        elements = elem.findall(M_E)
+        sep = f" {sep_chr} "
+
+        out.append(rf"\left{left} ")
+        for i, e in enumerate(elements):
+            if i:
+                out.append(sep)
+            self._emit_children(e, out)
+        out.append(rf" \right{right}")
+
+    def _handle_func(self, elem, out: list) -> None:
         """m:func (함수) → \\funcname{arg}."""
-        fname_elem = _find(elem, "m:fName")
-        e = _find(elem, "m:e")
+        fname_elem = elem.find(M_FNAME)
 
         fname = ""
         if fname_elem is not None:
             fname = self._process_children(fname_elem).strip()
 
-        content = self._process_children(e) if e is not None else ""
-
-        # 이미 LaTeX 명령이면 그대로 사용
-        known_funcs = {
-            "sin", "cos", "tan", "cot", "sec", "csc",
-            "arcsin", "arccos", "arctan",
-            "sinh", "cosh", "tanh",
-            "log", "ln", "exp", "lim", "max", "min",
-            "sup", "inf", "det", "dim", "gcd",
-        }
-
-        # 함수명에서 백슬래시 제거 후 확인
+        # 함수명에서 백슬래시 제거 후 확인 (이미 LaTeX 명령이면 그대로 사용)
         clean_name = fname.replace("\\", "").strip()
-        if clean_name in known_funcs:
-            return rf"\{clean_name} {content}"
-
-        return f"{fname} {content}"
+        if clean_name in KNOWN_FUNCS:
+            out.append(rf"\{clean_name} ")
+        else:
+            out.append(f"{fname} ")
+        self._emit_children(elem.find(M_E), out)
 
-    def _handle_acc(self, elem) -> str:
+    def _handle_acc(self, elem, out: list) -> None:
         """m:acc (악센트) → \\hat{e}, \\bar{e} 등."""
-        acc_pr = _find(elem, "m:accPr")
+        acc_pr = elem.find(M_ACCPR)
         accent_char = "\u0302"  # 기본: hat
         if acc_pr is not None:
-            chr_elem = _find(acc_pr, "m:chr")
+            chr_elem = acc_pr.find(M_CHR)
             if chr_elem is not None:
-                accent_char = chr_elem.get(_qn("m:val"), accent_char)
-
-        e = _find(elem, "m:e")
-        content = self._process_children(e) if e is not None else ""
+                accent_char = chr_elem.get(M_VAL, accent_char)
 
         latex_accent = ACCENT_MAP.get(accent_char, r"\hat")
-        return f"{latex_accent}{{{content}}}"
+        out.append(latex_accent + "{")
+        self._emit_children(elem.find(M_E), out)
+        out.append("}")
 
-    def _handle_bar(self, elem) -> str:
+    def _handle_bar(self, elem, out: list) -> None:
         """m:bar (윗줄/밑줄) → \\overline{e} 또는 \\underline{e}."""
-        bar_pr = _find(elem, "m:barPr")
+        bar_pr = elem.find(M_BARPR)
         pos = "top"
         if bar_pr is not None:
-            pos_elem = _find(bar_pr, "m:pos")
+            pos_elem = bar_pr.find(M_POS)
             if pos_elem is not None:
-                pos = pos_elem.get(_qn("m:val"), "top")
-
-        e = _find(elem, "m:e")
-        content = self._process_children(e) if e is not None else ""
+                pos = pos_elem.get(M_VAL, "top")
 
-        if pos == "bot":
-            return rf"\underline{{{content}}}"
-        return rf"\overline{{{content}}}"
+        out.append(r"\underline{" if pos == "bot" else r"\overline{")
+        self._emit_children(elem.find(M_E), out)
+        out.append("}")
 
-    def _handle_matrix(self, elem) -> str:
+    def _handle_matrix(self, elem, out: list) -> None:
         """m:m (행렬) → \\begin{matrix} ... \\end{matrix}."""
-        rows = _findall(elem, "m:mr")
-        row_strs = []
-        for row in rows:
-            cells = _findall(row, "m:e")
-            cell_strs = []
-            for cell in cells:
-                cell_strs.append(self._process_children(cell))
-            row_strs.append(" & ".join(cell_strs))
-
-        inner = r" \\ ".join(row_strs)
-        return rf"\begin{{matrix}} {inner} \end{{matrix}}"
-
-    def _handle_eqarr(self, elem) -> str:
+        out.append(r"\begin{matrix} ")
+        for i, row in enumerate(elem.findall(M_MR)):
+            if i:
+                out.append(r" \\ ")
+            for j, cell in enumerate(row.findall(M_E)):
+                if j:
+                    out.append(" & ")
+                self._emit_children(cell, out)
+        out.append(r" \end{matrix}")
+
+    def _handle_eqarr(self, elem, out: list) -> None:
         """m:eqArr (수식 배열) → \\begin{aligned} ... \\end{aligned}."""
-        equations = _findall(elem, "m:e")
-        parts = []
-        for eq in equations:
-            parts.append(self._process_children(eq))
-
-        inner = r" \\ ".join(parts)
-        return rf"\begin{{aligned}} {inner} \end{{aligned}}"
-
-    def _handle_limlow(self, elem) -> str:
+        out.append(r"\begin{aligned} ")
+        for i, eq in enumerate(elem.findall(M_E)):
+            if i:
+                out.append(r" \\ ")
+            self._emit_children(eq, out)
+        out.append(r" \end{aligned}")
+
+    def _handle_limlow(self, elem, out: list) -> None:
         """m:limLow (하한) → base_{lim}."""
-        e = _find(elem, "m:e")
-        lim = _find(elem, "m:lim")
-        base = self._process_children(e) if e is not None else ""
-        lim_text = self._process_children(lim) if lim is not None else ""
-        return f"{base}_{{{lim_text}}}"
+        self._emit_children(elem.find(M_E), out)
+        out.append("_{")
+        self._emit_children(elem.find(M_LIM), out)
+        out.append("}")
 
-    def _handle_limupp(self, elem) -> str:
+    def _handle_limupp(self, elem, out: list) -> None:
         """m:limUpp (상한) → base^{lim}."""
-        e = _find(elem, "m:e")
-        lim = _find(elem, "m:lim")
-        base = self._process_children(e) if e is not None else ""
-        lim_text = self._process_children(lim) if lim is not None else ""
-        return f"{base}^{{{lim_text}}}"
+        self._emit_children(elem.find(M_E), out)
+        out.append("^{")
+        self._emit_children(elem.find(M_LIM), out)
+        out.append("}")
 
-    def _handle_groupchr(self, elem) -> str:
+    def _handle_groupchr(self, elem, out: list) -> None:
         """m:groupChr (그룹 문자) → \\overbrace{e} 등."""
-        gpr = _find(elem, "m:groupChrPr")
+        gpr = elem.find(M_GROUPCHRPR)
         chr_val = "\u23df"  # 기본: underbrace
         pos = "bot"
 
         if gpr is not None:
-            chr_elem = _find(gpr, "m:chr")
+            chr_elem = gpr.find(M_CHR)
             if chr_elem is not None:
-                chr_val = chr_elem.get(_qn("m:val"), chr_val)
-            pos_elem = _find(gpr, "m:pos")
+                chr_val = chr_elem.get(M_VAL, chr_val)
+            pos_elem = gpr.find(M_POS)
             if pos_elem is not None:
-                pos = pos_elem.get(_qn("m:val"), "bot")
-
-        e = _find(elem, "m:e")
-        content = self._process_children(e) if e is not None else ""
+                pos = pos_elem.get(M_VAL, "bot")
 
         if chr_val == "\u23de" or pos == "top":
-            return rf"\overbrace{{{content}}}"
-        return rf"\underbrace{{{content}}}"
+            out.append(r"\overbrace{")
+        else:
+            out.append(r"\underbrace{")
+        self._emit_children(elem.find(M_E), out)
+        out.append("}")
 
-    def _handle_borderbox(self, elem) -> str:
+    def _handle_borderbox(self, elem, out: list) -> None:
         """m:borderBox (테두리 박스) → \\boxed{e}."""
-        e = _find(elem, "m:e")
-        content = self._process_children(e) if e is not None else ""
-        return rf"\boxed{{{content}}}"
+        out.append(r"\boxed{")
+        self._emit_children(elem.find(M_E), out)
+        out.append("}")
 
-    def _handle_box(self, elem) -> str:
+    def _handle_box(self, elem, out: list) -> None:
         """m:box (박스) → 내용만 추출."""
-        e = _find(elem, "m:e")
-        return self._process_children(e) if e is not None else ""
+        self._emit_children(elem.find(M_E), out)
 
-    def _handle_spre(self, elem) -> str:
+    def _handle_spre(self, elem, out: list) -> None:
         """m:sPre (전치 첨자) → {}_{sub}^{sup} base."""
-        sub = _find(elem, "m:sub")
-        sup = _find(elem, "m:sup")
-        e = _find(elem, "m:e")
+        sub = elem.find(M_SUB)
+        sup = elem.find(M_SUP)
 
         sub_text = self._process_children(sub) if sub is not None else ""
         sup_text = self._process_children(sup) if sup is not None else ""
-        content = self._process_children(e) if e is not None else ""
 
-        pre = "{}^"
-        result = ""
         if sub_text:
-            result += f"{{}}_{{{sub_text}}}"
+            out.append(f"{{}}_{{{sub_text}}}")
         if sup_text:
-            result += f"{{}}^{{{sup_text}}}"
-        result += f" {content}"
-
-        return result
+            out.append(f"{{}}^{{{sup_text}}}")
+        out.append(" ")
+        self._emit_children(elem.find(M_E), out)
+
+    # 태그별 핸들러 매핑 (클래스 정의 시 한 번만 생성, handler(self, elem, out)로 호출)
+    _HANDLERS = {
+        M_F: _handle_frac,
+        M_SSUP: _handle_ssup,
+        M_SSUB: _handle_ssub,
+        M_SSUBSUP: _handle_ssubsup,
+        M_RAD: _handle_rad,
+        M_NARY: _handle_nary,
+        M_D: _handle_delim,
+        M_FUNC: _handle_func,
+        M_ACC: _handle_acc,
+        M_BAR: _handle_bar,
+        M_M: _handle_matrix,
+        M_EQARR: _handle_eqarr,
+        M_LIMLOW: _handle_limlow,
+        M_LIMUPP: _handle_limupp,
+        M_GROUPCHR: _handle_groupchr,
+        M_BORDERBOX: _handle_borderbox,
+        M_BOX: _handle_box,
+        M_SPRE: _handle_spre,
+        M_R: _handle_run,
+    }
 
 
 # 모듈 레벨 싱글톤
 _converter = OMMLToLatex()
 
 
+# 직렬화한 수식 XML → LaTeX 변환 결과 (가득 차면 가장 먼저 넣은 항목부터 버림)
+_LATEX_CACHE: dict[bytes, str] = {}
+_LATEX_CACHE_SIZE = 1024
+
+
 def omml_to_latex(omath_elem) -> str:
     """OMML <m:oMath> 요소를 LaTeX 문자열로 변환한다.
 
+    문서에 같은 수식이 반복되는 경우가 많으므로, 요소를 직렬화한 바이트를
+    키로 변환 결과를 캐시한다. 캐시에 없으면 이미 파싱된 요소를 바로 변환한다.
+
     Args:
         omath_elem: lxml Element (<m:oMath> 또는 <m:oMathPara>)
 
     Returns:
         LaTeX 문자열
     """
-    return _converter.convert(omath_elem)
+    if omath_elem is None:
+        return ""
+    key = etree.tostring(omath_elem, with_tail=False)
+    latex = _LATEX_CACHE.get(key)
+    if latex is None:
+        latex = _converter.convert(omath_elem)
+        if len(_LATEX_CACHE) >= _LATEX_CACHE_SIZE:
+            del _LATEX_CACHE[next(iter(_LATEX_CACHE))]
+        _LATEX_CACHE[key] = latex
+    return latex
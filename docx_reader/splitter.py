@@ -13,30 +13,46 @@ import re
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Question:
     """분리된 문항."""
     number: int       # 문항 번호 (1부터 시작)
     title: str        # 문항 제목 (번호 포함)
     body: str         # 문항 본문 (제목 포함 전체 텍스트)
+    content: str      # 문항 번호 표시("1.", "문제 1" 등)를 뺀 본문
 
 
-# 문항 시작을 감지하는 정규식 패턴들 (우선순위 순)
+# 문항 시작을 감지하는 정규식 패턴들 (우선순위 순, 모두 줄 시작에서 검사)
 _QUESTION_PATTERNS = [
     # "문제 1", "문제 1.", "문제1" 등
-    re.compile(r"^문제\s*(\d+)[.)]?\s", re.MULTILINE),
+    r"문제\s*(\d+)[.)]?\s",
     # "제1문", "제2문" 등
-    re.compile(r"^제\s*(\d+)\s*문", re.MULTILINE),
+    r"제\s*(\d+)\s*문",
     # "[1]", "[2]" 등 (줄 시작)
-    re.compile(r"^\[(\d+)\]", re.MULTILINE),
+    r"\[(\d+)\]",
     # "Q1.", "Q1)", "Q1 " 등
-    re.compile(r"^Q(\d+)[.):\s]", re.MULTILINE),
+    r"Q(\d+)[.):\s]",
     # "1.", "2.", "3." (줄 시작, 단 소수점과 구분하기 위해 뒤에 공백 필요)
-    re.compile(r"^(\d+)\.\s", re.MULTILINE),
+    r"(\d+)\.\s",
     # "1)", "2)", "3)" (줄 시작)
-    re.compile(r"^(\d+)\)\s", re.MULTILINE),
+    r"(\d+)\)\s",
 ]
 
+# 모든 패턴을 하나로 합친 정규식. 각 패턴은 lookahead 안에 두어
+# 매치가 문자를 소비하지 않으므로, 패턴별로 따로 finditer 했을 때와
+# 같은 매치 위치를 텍스트 한 번 스캔으로 얻는다.
+_QUESTION_RE = re.compile(
+    "^(?:" + "|".join(
+        f"(?=(?P<p{i}>{pattern}))" for i, pattern in enumerate(_QUESTION_PATTERNS)
+    ) + ")",
+    re.MULTILINE,
+)
+
+# 패턴 이름(lastgroup) → 문항 번호 캡처 그룹 인덱스 (우선순위 순)
+_NUMBER_GROUPS = {
+    name: index + 1 for name, index in _QUESTION_RE.groupindex.items()
+}
+
 
 def split_questions(text: str) -> list[Question]:
     """텍스트를 문항 단위로 분리한다.
@@ -53,23 +69,32 @@ def split_questions(text: str) -> list[Question]:
     if not text.strip():
         return []
 
-    best_matches = []
-    best_pattern = None
+    # 한 번의 스캔으로 얻은 매치를 패턴별로 분류
+    matches_by_pattern: dict[str, list[re.Match]] = {}
+    for match in _QUESTION_RE.finditer(text):
+        matches_by_pattern.setdefault(match.lastgroup, []).append(match)
 
-    for pattern in _QUESTION_PATTERNS:
-        matches = list(pattern.finditer(text))
+    # 매치가 가장 많은 패턴 선택 (동률이면 우선순위가 높은 패턴)
+    best_matches = []
+    best_group = 0
+    for name, group in _NUMBER_GROUPS.items():
+        matches = matches_by_pattern.get(name, [])
         if len(matches) > len(best_matches):
             best_matches = matches
-            best_pattern = pattern
+            best_group = group
 
     # 매치가 없으면 전체를 하나의 문항으로
     if not best_matches:
-        return [Question(number=1, title="문제 1", body=text.strip())]
+        body = text.strip()
+        return [Question(number=1, title="문제 1", body=body, content=body)]
 
     questions = []
     for i, match in enumerate(best_matches):
-        number = int(match.group(1))
+        number = int(match.group(best_group))
         start = match.start()
+        # lookahead 매치라 match.end()는 시작 위치와 같으므로, 번호 표시의 끝은
+        # 패턴 그룹에서 얻는다
+        marker_end = match.end(match.lastgroup)
 
         # 다음 문항 시작 또는 문서 끝까지
         if i + 1 < len(best_matches):
@@ -79,10 +104,15 @@ def split_questions(text: str) -> list[Question]:
 
         body = text[start:end].strip()
 
-        # 제목: 첫 번째 줄 (또는 첫 100자)
-        first_line = body.split("\n")[0].strip()
-        title = first_line[:100] if len(first_line) > 100 else first_line
+        # 제목: 첫 번째 줄 (최대 100자)
+        newline = body.find("\n")
+        first_line = (body[:newline] if newline >= 0 else body).strip()
+        title = first_line[:100]
+
+        content = text[marker_end:end].strip()
 
-        questions.append(Question(number=number, title=title, body=body))
+        questions.append(Question(
+            number=number, title=title, body=body, content=content,
+        ))
 
     return questions
@@ -1,3 +1,9 @@
 """GPT 풀이 생성 패키지."""
 
-from .client import solve_question
+from .client import (
+    solve_question,
+    solve_question_async,
+    solve_group_async,
+    solve_many,
+    solve_questions_batch,
+)
@@ -0,0 +1,45 @@
+"""GPT 응답 디스크 캐시.
+
+같은 문서를 다시 처리할 때 동일한 요청으로 API를 반복 호출하지 않도록,
+(모델, 프롬프트) 해시를 키로 하여 풀이 코드를 파일로 저장한다.
+"""
+
+import hashlib
+import os
+
+import config
+
+
+def make_key(model: str, messages: list[dict], group: bool = False) -> str:
+    """모델명과 요청 메시지로 캐시 키(SHA-256 hex)를 만든다.
+
+    group이 True이면 묶음 요청으로 얻은 풀이용 키를 만든다. 같은 문항이라도
+    문항별 요청의 키와 겹치지 않는다.
+    """
+    h = hashlib.sha256(model.encode("utf-8"))
+    if group:
+        h.update(b"\0group")
+    for message in messages:
+        h.update(b"\0")
+        h.update(message["content"].encode("utf-8"))
+    return h.hexdigest()
+
+
+def get(key: str) -> str | None:
+    """캐시된 풀이 코드를 반환한다. 없으면 None."""
+    try:
+        return (config.CACHE_DIR / f"{key}.py").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def put(key: str, value: str) -> None:
+    """풀이 코드를 캐시에 저장한다. 저장 실패는 무시한다."""
+    path = config.CACHE_DIR / f"{key}.py"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(value, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
@@ -1,15 +1,34 @@
 """OpenAI API 클라이언트 래퍼.
 
 재시도 로직과 응답 후처리를 포함한다.
+openai 패키지는 import 비용이 커서(httpx, pydantic 등) 실제로 API를
+호출하는 함수 안에서 불러온다.
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import json
+import logging
+import random
 import re
 import time
-
-from openai import OpenAI, RateLimitError, APIError
+from typing import TYPE_CHECKING, Callable
 
 import config
-from .prompts import SYSTEM_PROMPT, build_user_prompt
+from . import cache
+from .prompts import SYSTEM_PROMPT, build_group_user_prompt, build_user_prompt
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+logger = logging.getLogger(__name__)
+
+
+# ```python\n...\n``` 또는 ```\n...\n``` 코드 펜스
+_CODE_FENCE_RE = re.compile(r"^```(?:python|py)?\s*\n(.*?)```\s*$", re.DOTALL)
 
 
 def _strip_code_fences(text: str) -> str:
@@ -17,18 +36,111 @@ def _strip_code_fences(text: str) -> str:
 
     GPT가 ```python ... ``` 로 감싸서 응답하는 경우를 처리한다.
     """
-    # ```python\n...\n``` 또는 ```\n...\n``` 패턴 제거
-    pattern = r"^```(?:python|py)?\s*\n(.*?)```\s*$"
-    match = re.match(pattern, text.strip(), re.DOTALL)
+    text = text.strip()
+    match = _CODE_FENCE_RE.match(text)
     if match:
         return match.group(1).strip()
-    return text.strip()
+    return text
+
+
+def _resolve_api_key(api_key: str | None) -> str:
+    """API 키를 확인한다. 설정되지 않았으면 RuntimeError를 발생시킨다."""
+    api_key = api_key or config.OPENAI_API_KEY
+    if not api_key:
+        raise RuntimeError(
+            "OPENAI_API_KEY가 설정되지 않았습니다. "
+            ".env 파일에 OPENAI_API_KEY를 설정해주세요."
+        )
+    return api_key
+
+
+def _build_messages(question_body: str) -> list[dict]:
+    """Chat Completions 요청 메시지를 구성한다."""
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": build_user_prompt(question_body)},
+    ]
+
+
+def _is_retryable(error: Exception) -> bool:
+    """재시도하면 성공할 수 있는 일시적인 오류인지 판단한다.
+
+    Rate limit(429), 연결 오류/타임아웃, 서버 오류(5xx)만 재시도한다.
+    잘못된 요청이나 인증 오류(4xx)는 몇 번을 다시 보내도 같은 결과다.
+    """
+    from openai import APIConnectionError, APIStatusError, RateLimitError
+
+    if isinstance(error, (RateLimitError, APIConnectionError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+
+def _retry_delay(attempt: int) -> float:
+    """attempt번째 실패 후 대기 시간(초). 지수 백오프에 지터를 더한다.
+
+    여러 문항이 동시에 rate limit에 걸렸을 때 같은 시각에 다시 몰리지 않도록
+    대기 시간을 [절반, 전체] 구간에서 무작위로 고른다.
+    """
+    delay = min(config.RETRY_BASE_DELAY * (2 ** attempt), config.RETRY_MAX_DELAY)
+    return random.uniform(delay / 2, delay)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> OpenAI:
+    """API 키별 OpenAI 클라이언트를 재사용한다.
+
+    문항마다 클라이언트를 새로 만들면 커넥션 풀이 매번 초기화되어
+    HTTP keep-alive 연결을 재사용할 수 없다.
+    """
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key)
+
+
+async def _complete_async(
+    client: AsyncOpenAI,
+    model: str,
+    messages: list[dict],
+    **kwargs,
+) -> str:
+    """Chat Completions를 호출해 응답 본문을 반환한다. 일시적인 오류는 재시도한다.
+
+    동시에 여러 요청이 진행되므로 중간 시도는 출력하지 않고
+    최종 실패 메시지에만 시도 횟수를 남긴다.
+
+    Raises:
+        RuntimeError: 재시도할 수 없는 오류이거나 최대 재시도 횟수 초과 시
+    """
+    from openai import APIError
+
+    last_error = None
+    for attempt in range(config.MAX_RETRIES):
+        try:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=config.TEMPERATURE,
+                **kwargs,
+            )
+            return response.choices[0].message.content or ""
+
+        except APIError as e:
+            if not _is_retryable(e):
+                raise RuntimeError(f"API 호출 실패: {e}") from e
+            last_error = e
+            if attempt + 1 < config.MAX_RETRIES:
+                await asyncio.sleep(_retry_delay(attempt))
+
+    raise RuntimeError(
+        f"API 호출이 {config.MAX_RETRIES}회 실패했습니다: {last_error}"
+    )
 
 
 def solve_question(
     question_body: str,
     model: str | None = None,
     api_key: str | None = None,
+    use_cache: bool = True,
 ) -> str:
     """GPT API를 호출하여 문제의 파이썬 풀이를 생성한다.
 
@@ -36,51 +148,442 @@ def solve_question(
         question_body: 문제 본문 (LaTeX 수식 포함 가능)
         model: 사용할 모델명 (기본: config.DEFAULT_MODEL)
         api_key: OpenAI API 키 (기본: config.OPENAI_API_KEY)
+        use_cache: False이면 응답 캐시를 읽지도 쓰지도 않는다
 
     Returns:
         파이썬 코드 문자열
 
     Raises:
-        RuntimeError: 최대 재시도 횟수 초과 시
+        RuntimeError: 재시도할 수 없는 오류이거나 최대 재시도 횟수 초과 시
     """
+    from openai import APIError, RateLimitError
+
     model = model or config.DEFAULT_MODEL
-    api_key = api_key or config.OPENAI_API_KEY
+    messages = _build_messages(question_body)
 
-    if not api_key:
-        raise RuntimeError(
-            "OPENAI_API_KEY가 설정되지 않았습니다. "
-            ".env 파일에 OPENAI_API_KEY를 설정해주세요."
-        )
+    # 같은 요청의 이전 응답이 있으면 API를 호출하지 않는다
+    cache_key = cache.make_key(model, messages)
+    cached = cache.get(cache_key) if use_cache else None
+    if cached is not None:
+        return cached
 
-    client = OpenAI(api_key=api_key)
-    user_prompt = build_user_prompt(question_body)
+    client = _get_client(_resolve_api_key(api_key))
 
     last_error = None
     for attempt in range(config.MAX_RETRIES):
         try:
             response = client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
+                messages=messages,
                 temperature=config.TEMPERATURE,
             )
             content = response.choices[0].message.content or ""
-            return _strip_code_fences(content)
-
-        except RateLimitError as e:
-            last_error = e
-            delay = config.RETRY_BASE_DELAY * (2 ** attempt)
-            print(f"  Rate limit 초과. {delay}초 후 재시도... ({attempt + 1}/{config.MAX_RETRIES})")
-            time.sleep(delay)
+            code = _strip_code_fences(content)
+            if use_cache:
+                cache.put(cache_key, code)
+            return code
 
         except APIError as e:
+            if not _is_retryable(e):
+                raise RuntimeError(f"API 호출 실패: {e}") from e
             last_error = e
-            delay = config.RETRY_BASE_DELAY * (2 ** attempt)
-            print(f"  API 오류: {e}. {delay}초 후 재시도... ({attempt + 1}/{config.MAX_RETRIES})")
+            if attempt + 1 == config.MAX_RETRIES:
+                break
+            delay = _retry_delay(attempt)
+            reason = "Rate limit 초과" if isinstance(e, RateLimitError) else f"API 오류: {e}"
+            logger.warning(f"  {reason}. {delay:.1f}초 후 재시도... ({attempt + 1}/{config.MAX_RETRIES})")
             time.sleep(delay)
 
     raise RuntimeError(
         f"API 호출이 {config.MAX_RETRIES}회 실패했습니다: {last_error}"
     )
+
+
+async def solve_question_async(
+    question_body: str,
+    model: str | None = None,
+    client: AsyncOpenAI | None = None,
+    api_key: str | None = None,
+    use_cache: bool = True,
+) -> str:
+    """solve_question의 비동기 버전.
+
+    재시도 대기는 asyncio.sleep으로 하므로 다른 문항의 요청을 막지 않는다.
+    중간 재시도는 출력하지 않는다.
+
+    Args:
+        question_body: 문제 본문 (LaTeX 수식 포함 가능)
+        model: 사용할 모델명 (기본: config.DEFAULT_MODEL)
+        client: 공유할 AsyncOpenAI 클라이언트 (None이면 api_key로 새로 생성)
+        api_key: OpenAI API 키 (기본: config.OPENAI_API_KEY)
+        use_cache: False이면 응답 캐시를 읽지도 쓰지도 않는다
+
+    Returns:
+        파이썬 코드 문자열
+
+    Raises:
+        RuntimeError: 재시도할 수 없는 오류이거나 최대 재시도 횟수 초과 시
+    """
+    from openai import AsyncOpenAI
+
+    model = model or config.DEFAULT_MODEL
+    messages = _build_messages(question_body)
+
+    cache_key = cache.make_key(model, messages)
+    cached = cache.get(cache_key) if use_cache else None
+    if cached is not None:
+        return cached
+
+    if client is None:
+        async with AsyncOpenAI(api_key=_resolve_api_key(api_key)) as client:
+            return await solve_question_async(
+                question_body, model, client, use_cache=use_cache
+            )
+
+    content = await _complete_async(client, model, messages)
+    code = _strip_code_fences(content)
+    if use_cache:
+        cache.put(cache_key, code)
+    return code
+
+
+def _parse_group_response(content: str, count: int) -> list[str] | None:
+    """여러 문제 요청의 JSON 응답에서 풀이 코드 리스트를 꺼낸다.
+
+    형식이 맞지 않거나 풀이 개수가 문제 수와 다르면 None을 반환한다.
+    """
+    try:
+        solutions = json.loads(content)["solutions"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    if (
+        not isinstance(solutions, list)
+        or len(solutions) != count
+        or not all(isinstance(code, str) for code in solutions)
+    ):
+        return None
+    return [_strip_code_fences(code) for code in solutions]
+
+
+async def solve_group_async(
+    question_bodies: list[str],
+    model: str | None = None,
+    client: AsyncOpenAI | None = None,
+    api_key: str | None = None,
+    use_cache: bool = True,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[str | Exception]:
+    """여러 문제를 요청 하나로 묶어 풀이한다.
+
+    시스템 프롬프트와 요청당 고정 비용을 문제 수만큼 나누어 쓰도록,
+    JSON 모드로 {"solutions": [...]} 형태의 응답을 받는다. 묶음 요청이
+    실패하거나(프롬프트가 너무 긴 경우 등) 응답을 해석할 수 없으면 캐시에
+    없던 문항만 한 문제씩 다시 요청한다.
+    문항별 요청으로 캐시된 풀이가 있으면 그대로 쓰고, 묶음 요청으로 얻은
+    풀이는 별도의 키(cache.make_key의 group=True)로 저장하여 문항별 요청이
+    묶음 풀이를 재사용하지 않도록 한다.
+
+    Args:
+        question_bodies: 문제 본문 리스트
+        model: 사용할 모델명 (기본: config.DEFAULT_MODEL)
+        client: 공유할 AsyncOpenAI 클라이언트 (None이면 api_key로 새로 생성)
+        api_key: OpenAI API 키 (기본: config.OPENAI_API_KEY)
+        use_cache: False이면 응답 캐시를 읽지도 쓰지도 않는다
+        semaphore: API 요청마다 잡을 세마포어 (None이면 제한하지 않음).
+            묶음 요청과 문항별 재요청이 각각 한 자리씩 차지한다.
+
+    Returns:
+        입력 순서대로 정렬된 결과 리스트. 한 문제씩 다시 요청하다 실패한
+        문항에는 예외 객체가 들어 있다.
+    """
+    from openai import AsyncOpenAI
+
+    model = model or config.DEFAULT_MODEL
+
+    results: list[str | Exception | None] = [None] * len(question_bodies)
+    cache_keys = {}
+    for i, body in enumerate(question_bodies):
+        messages = _build_messages(body)
+        group_key = cache.make_key(model, messages, group=True)
+        cached = None
+        if use_cache:
+            cached = cache.get(cache.make_key(model, messages))
+            if cached is None:
+                cached = cache.get(group_key)
+        if cached is not None:
+            results[i] = cached
+        else:
+            cache_keys[i] = group_key
+
+    if not cache_keys:
+        return results
+
+    if client is None:
+        async with AsyncOpenAI(api_key=_resolve_api_key(api_key)) as client:
+            return await solve_group_async(
+                question_bodies, model, client,
+                use_cache=use_cache, semaphore=semaphore,
+            )
+
+    def _slot():
+        return semaphore if semaphore is not None else contextlib.nullcontext()
+
+    async def _solve_one(body: str) -> str:
+        async with _slot():
+            return await solve_question_async(body, model, client, use_cache=use_cache)
+
+    pending = list(cache_keys)
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": build_group_user_prompt(
+            [question_bodies[i] for i in pending]
+        )},
+    ]
+    try:
+        async with _slot():
+            content = await _complete_async(
+                client, model, messages, response_format={"type": "json_object"},
+            )
+    except RuntimeError:
+        codes = None
+    else:
+        codes = _parse_group_response(content, len(pending))
+
+    if codes is None:
+        # 묶음 요청이 실패했거나 응답을 해석할 수 없으면 문항별로 다시 요청
+        codes = await asyncio.gather(
+            *(_solve_one(question_bodies[i]) for i in pending),
+            return_exceptions=True,
+        )
+    elif use_cache:
+        for i, code in zip(pending, codes):
+            cache.put(cache_keys[i], code)
+
+    for i, code in zip(pending, codes):
+        results[i] = code
+    return results
+
+
+async def solve_many(
+    question_bodies: list[str],
+    model: str | None = None,
+    api_key: str | None = None,
+    concurrency: int = config.MAX_CONCURRENCY,
+    use_cache: bool = True,
+    group_size: int = 1,
+    on_result: Callable[[int, str | Exception], None] | None = None,
+) -> list[str | Exception]:
+    """여러 문제를 동시에 풀이한다.
+
+    하나의 AsyncOpenAI 클라이언트를 공유하고, 세마포어로 동시 요청 수를 제한한다.
+    캐시에 있는 문항은 먼저 채우고, 모두 캐시에 있으면 API 키 없이도 동작한다.
+
+    Args:
+        question_bodies: 문제 본문 리스트
+        model: 사용할 모델명 (기본: config.DEFAULT_MODEL)
+        api_key: OpenAI API 키 (기본: config.OPENAI_API_KEY)
+        concurrency: 최대 동시 요청 수
+        use_cache: False이면 응답 캐시를 읽지도 쓰지도 않는다
+        group_size: 요청 하나에 묶을 문항 수 (1이면 문항마다 따로 요청,
+            2 이상이면 solve_group_async로 묶어서 요청)
+        on_result: 문항 하나가 끝날 때마다 (입력 인덱스, 코드 또는 예외)로
+            호출되는 콜백 (진행 상황 출력용)
+
+    Returns:
+        입력 순서대로 정렬된 결과 리스트. 성공한 문항은 코드 문자열,
+        실패한 문항은 발생한 예외 객체가 들어 있다. API 키 누락처럼 요청
+        전체가 불가능한 경우에도 예외를 던지지 않고, 캐시에 없던 문항에만
+        그 예외를 담는다.
+    """
+    from openai import AsyncOpenAI
+
+    model = model or config.DEFAULT_MODEL
+    results: list[str | Exception | None] = [None] * len(question_bodies)
+
+    # 캐시에 있는 문항은 API 키 확인이나 클라이언트 생성 없이 바로 채운다
+    pending = []
+    for i, body in enumerate(question_bodies):
+        cached = cache.get(cache.make_key(model, _build_messages(body))) if use_cache else None
+        if cached is None:
+            pending.append(i)
+            continue
+        results[i] = cached
+        if on_result is not None:
+            on_result(i, cached)
+
+    if not pending:
+        return results
+
+    try:
+        client = AsyncOpenAI(api_key=_resolve_api_key(api_key))
+    except Exception as e:
+        # API 키가 없는 등 클라이언트를 만들 수 없으면 캐시에 없던 문항만 실패 처리
+        for i in pending:
+            results[i] = e
+            if on_result is not None:
+                on_result(i, e)
+        return results
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with client:
+
+        async def _solve(indices: list[int]) -> None:
+            bodies = [question_bodies[i] for i in indices]
+            try:
+                if group_size == 1:
+                    async with semaphore:
+                        codes = [await solve_question_async(
+                            bodies[0], model, client, use_cache=use_cache
+                        )]
+                else:
+                    # 묶음 요청과 문항별 재요청이 각자 세마포어를 잡는다
+                    codes = await solve_group_async(
+                        bodies, model, client,
+                        use_cache=use_cache, semaphore=semaphore,
+                    )
+            except Exception as e:
+                codes = [e] * len(bodies)
+            for index, result in zip(indices, codes):
+                results[index] = result
+                if on_result is not None:
+                    on_result(index, result)
+
+        await asyncio.gather(
+            *(_solve(pending[start:start + group_size])
+              for start in range(0, len(pending), group_size))
+        )
+
+    return results
+
+
+# Batch 작업이 더 이상 진행되지 않는 상태
+_BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _parse_batch_line(line: str) -> tuple[int, str | Exception]:
+    """Batch 결과 파일의 한 줄을 (입력 인덱스, 코드 또는 예외)로 변환한다."""
+    record = json.loads(line)
+    index = int(record["custom_id"])
+
+    error = record.get("error")
+    response = record.get("response") or {}
+    body = response.get("body") or {}
+    if error:
+        return index, RuntimeError(f"Batch 요청 실패: {error.get('message', error)}")
+    if response.get("status_code") != 200:
+        message = (body.get("error") or {}).get("message", body)
+        return index, RuntimeError(
+            f"Batch 요청 실패 (HTTP {response.get('status_code')}): {message}"
+        )
+
+    content = body["choices"][0]["message"].get("content") or ""
+    return index, _strip_code_fences(content)
+
+
+def _submit_batch(client: OpenAI, lines: list[str]):
+    """요청 JSONL을 업로드하고 Batch 작업을 생성한다."""
+    input_file = client.files.create(
+        file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    return client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+
+def solve_questions_batch(
+    question_bodies: list[str],
+    model: str | None = None,
+    api_key: str | None = None,
+    poll_interval: float = config.BATCH_POLL_INTERVAL,
+    use_cache: bool = True,
+    on_created: Callable[[str], None] | None = None,
+) -> list[str | Exception]:
+    """OpenAI Batch API로 여러 문제를 한 번에 풀이한다.
+
+    요청마다 JSONL 한 줄을 만들어 업로드하고, 작업이 끝날 때까지 상태를
+    폴링한 뒤 결과 파일을 내려받는다. 응답은 최대 24시간까지 걸릴 수 있지만
+    토큰 비용이 절반이고 분당 요청 제한을 받지 않는다.
+    캐시에 있는 문항은 Batch에 포함하지 않는다.
+
+    Args:
+        question_bodies: 문제 본문 리스트
+        model: 사용할 모델명 (기본: config.DEFAULT_MODEL)
+        api_key: OpenAI API 키 (기본: config.OPENAI_API_KEY)
+        poll_interval: 상태 확인 간격 (초)
+        use_cache: False이면 응답 캐시를 읽지도 쓰지도 않는다
+        on_created: Batch 작업이 생성되면 작업 ID로 호출되는 콜백
+            (폴링 전에 작업 ID를 바로 출력하는 용도)
+
+    Returns:
+        입력 순서대로 정렬된 결과 리스트. 성공한 문항은 코드 문자열,
+        실패한 문항은 예외 객체가 들어 있다. API 키가 없거나 Batch 작업
+        자체가 실패/만료/취소된 경우에도 캐시 결과는 그대로 두고, 캐시에
+        없던 문항에만 해당 예외를 넣는다.
+    """
+    model = model or config.DEFAULT_MODEL
+
+    results: list[str | Exception | None] = [None] * len(question_bodies)
+    cache_keys = {}
+    lines = []
+    for i, body in enumerate(question_bodies):
+        messages = _build_messages(body)
+        cache_key = cache.make_key(model, messages)
+        cached = cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            results[i] = cached
+            continue
+        cache_keys[i] = cache_key
+        lines.append(json.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": messages,
+                "temperature": config.TEMPERATURE,
+            },
+        }, ensure_ascii=False))
+
+    if not lines:
+        return results
+
+    try:
+        client = _get_client(_resolve_api_key(api_key))
+        batch = _submit_batch(client, lines)
+        logger.info(f"  Batch 작업 생성: {batch.id} ({len(lines)}개 요청)")
+        if on_created is not None:
+            on_created(batch.id)
+
+        while batch.status not in _BATCH_FINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch 작업이 완료되지 않았습니다: {batch.id} ({batch.status})")
+    except Exception as e:
+        # API 키 누락, Batch 작업 실패/만료/취소 등은 캐시에 없던 문항의 결과로 돌려준다
+        for index in cache_keys:
+            results[index] = e
+        return results
+
+    # 성공 응답은 output 파일, 실패한 요청은 error 파일에 기록된다
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        for line in client.files.content(file_id).text.splitlines():
+            if not line.strip():
+                continue
+            index, result = _parse_batch_line(line)
+            results[index] = result
+            if use_cache and isinstance(result, str):
+                cache.put(cache_keys[index], result)
+
+    for index in cache_keys:
+        if results[index] is None:
+            results[index] = RuntimeError("Batch 결과에 응답이 없습니다")
+
+    return results
@@ -23,3 +23,22 @@ USER_PROMPT_TEMPLATE = """\
 def build_user_prompt(question_body: str) -> str:
     """유저 프롬프트를 생성한다."""
     return USER_PROMPT_TEMPLATE.format(question_body=question_body)
+
+
+GROUP_USER_PROMPT_TEMPLATE = """\
+다음 {count}개의 문제를 각각 파이썬 코드로 풀어주세요.
+각 풀이 코드를 문자열 하나로 하여, 문제 순서대로 {count}개를 담은 JSON 객체로 응답하세요:
+{{"solutions": ["문제 1의 풀이 코드", "문제 2의 풀이 코드", ...]}}
+
+{questions}
+"""
+
+
+def build_group_user_prompt(question_bodies: list[str]) -> str:
+    """여러 문제를 한 번에 요청하는 유저 프롬프트를 생성한다."""
+    questions = "\n\n".join(
+        f"### 문제 {i}\n{body}" for i, body in enumerate(question_bodies, 1)
+    )
+    return GROUP_USER_PROMPT_TEMPLATE.format(
+        count=len(question_bodies), questions=questions,
+    )
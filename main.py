@@ -1,19 +1,29 @@
 """Word to Jupyter Notebook Solver - CLI 진입점.
 
 사용법:
-    python main.py input.docx [-o output.ipynb] [-m gpt-4o-mini] [--dry-run]
+    python main.py input.docx [input2.docx ...] [-o output.ipynb] [-m gpt-4o-mini] [--dry-run] [--batch] [--group-size N] [--no-cache] [-q]
 """
 
 import argparse
+import asyncio
+import logging
+import logging.handlers
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from docx_reader import extract_document, split_questions
-from gpt_solver import solve_question
-from notebook_builder import build_notebook
-from notebook_builder.builder import SolvedQuestion
 import config
 
+logger = logging.getLogger(__name__)
+
+# 문항 미리보기를 한 줄로 출력하기 위한 줄바꿈 → 공백 변환 테이블
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+# 진행 메시지를 모아서 출력할 개수
+_LOG_BUFFER_CAPACITY = 16
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -21,12 +31,13 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "input",
-        help="입력 Word 파일 경로 (.docx)",
+        nargs="+",
+        help="입력 Word 파일 경로 (.docx). 여러 개를 지정하면 추출을 병렬로 처리",
     )
     parser.add_argument(
         "-o", "--output",
         default=None,
-        help="출력 노트북 파일 경로 (.ipynb). 미지정 시 입력 파일명 기반 자동 생성",
+        help="출력 노트북 파일 경로 (.ipynb). 미지정 시 입력 파일명 기반 자동 생성 (입력이 하나일 때만 사용 가능)",
     )
     parser.add_argument(
         "-m", "--model",
@@ -38,82 +49,260 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="API 호출 없이 문서 추출/문항 분리 결과만 출력",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="OpenAI Batch API로 풀이 (비용 절반, 완료까지 최대 24시간 소요)",
+    )
+    parser.add_argument(
+        "--group-size",
+        type=int,
+        default=1,
+        metavar="N",
+        help="요청 하나에 묶어 보낼 문항 수 (기본: 1, 응답 형식이 어긋나면 문항별로 다시 요청)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="응답 캐시를 사용하지 않고 모든 문항을 새로 요청",
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="문항별 미리보기와 진행 상황을 출력하지 않음",
+    )
+    args = parser.parse_args()
+    if args.group_size < 1:
+        parser.error("--group-size는 1 이상이어야 합니다")
+    return args
 
 
-def main():
-    args = parse_args()
+def setup_logging() -> None:
+    """진행 메시지를 stderr로 출력하도록 로깅을 설정한다.
 
-    input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"오류: 파일을 찾을 수 없습니다: {args.input}", file=sys.stderr)
-        sys.exit(1)
+    INFO 메시지는 MemoryHandler에 모아 두었다가 한 번에 출력하고,
+    경고 이상은 쌓인 메시지와 함께 즉시 출력한다. 오래 기다리는 작업 전,
+    문항별 풀이 결과, Batch 작업 ID는 flush하여 바로 보이게 한다.
+    httpx 등 외부 라이브러리의 INFO 로그는 출력하지 않도록 이 프로그램의
+    로거만 INFO로 둔다.
+    """
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(logging.Formatter("%(message)s"))
+    handler = logging.handlers.MemoryHandler(
+        _LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=stream,
+    )
+    logging.getLogger().addHandler(handler)
+    for name in (__name__, "gpt_solver"):
+        logging.getLogger(name).setLevel(logging.INFO)
 
-    # 출력 경로 설정
-    if args.output:
-        output_path = args.output
-    else:
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
-        output_path = str(output_dir / input_path.with_suffix(".ipynb").name)
 
-    total_steps = 2 if args.dry_run else 4
+def flush_logs() -> None:
+    """모아 둔 진행 메시지를 바로 출력한다. 오래 기다리는 작업 전에 호출한다."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+def _write_stdout(text: str) -> None:
+    """긴 텍스트를 print 대신 stdout 바이트 버퍼에 한 번에 쓴다.
+
+    텍스트 계층을 거치지 않도록 미리 인코딩하며, 콘솔 인코딩으로 표현할 수
+    없는 문자는 대체 문자로 바꾼다.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(text)
+        return
+    sys.stdout.flush()
+    buffer.write(text.encode(sys.stdout.encoding or "utf-8", errors="replace"))
+    buffer.write(b"\n")
+    buffer.flush()
+
+
+def extract_documents(input_paths: list[Path]) -> list[str | Exception]:
+    """여러 문서를 추출한다. 실패한 문서는 예외 객체를 담아 반환한다.
+
+    XML 파싱은 CPU 작업이라 스레드로는 GIL 때문에 병렬화되지 않으므로,
+    문서가 여러 개면 프로세스 풀에서 나누어 처리한다.
+    """
+    if len(input_paths) == 1:
+        try:
+            return [extract_document(input_paths[0])]
+        except Exception as e:
+            return [e]
+
+    results = []
+    workers = min(len(input_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(extract_document, p) for p in input_paths]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+    return results
 
-    # ── 1단계: 문서 추출 ──
-    print(f"[1/{total_steps}] 문서에서 텍스트와 수식을 추출합니다...")
-    try:
-        full_text = extract_document(str(input_path))
-    except Exception as e:
-        print(f"오류: 문서 추출 실패 - {e}", file=sys.stderr)
-        sys.exit(1)
 
-    print(f"  추출 완료: {len(full_text)}자")
+def output_path_for(args: argparse.Namespace, input_path: Path) -> Path:
+    """입력 문서의 출력 노트북 경로. -o가 없으면 output/{입력파일명}.ipynb"""
+    if args.output:
+        return Path(args.output)
+    return Path("output") / input_path.with_suffix(".ipynb").name
+
+
+def process_document(
+    args: argparse.Namespace,
+    input_path: Path,
+    output_path: Path,
+    full_text: str,
+    total_steps: int,
+) -> None:
+    """추출된 문서 하나를 문항 분리 → 풀이 → 노트북 저장까지 처리한다."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # ── 2단계: 문항 분리 ──
-    print(f"[2/{total_steps}] 문항을 분리합니다...")
+    logger.info(f"[2/{total_steps}] 문항을 분리합니다...")
     questions = split_questions(full_text)
-    print(f"  {len(questions)}개 문항 감지")
+    logger.info(f"  {len(questions)}개 문항 감지")
 
-    for q in questions:
-        preview = q.body[:80].replace("\n", " ")
-        print(f"  - 문제 {q.number}: {preview}...")
+    if not args.quiet:
+        for q in questions:
+            preview = q.body[:80].translate(_NL_TABLE)
+            logger.info(f"  - 문제 {q.number}: {preview}...")
 
-    # dry-run 모드
+    # dry-run 결과는 진행 메시지(stderr)가 아니라 stdout으로 출력한다
     if args.dry_run:
+        flush_logs()
         print("\n=== Dry-run 모드: 추출 결과 ===\n")
-        print(full_text)
-        print(f"\n=== {len(questions)}개 문항 분리 완료 ===")
+        _write_stdout(full_text)
+        print(f"\n=== {len(questions)}개 문항 분리 완료 ===", flush=True)
         return
 
+    # nbformat(jsonschema 포함) import 비용이 커서 --dry-run에서는 불러오지 않는다
+    from gpt_solver import solve_many, solve_questions_batch
+    from notebook_builder import build_notebook
+    from notebook_builder.builder import SolvedQuestion
+
     # ── 3단계: GPT 풀이 생성 ──
-    print(f"[3/{total_steps}] GPT ({args.model})로 풀이를 생성합니다...")
-    solved = []
-    for i, q in enumerate(questions, 1):
-        print(f"  [{i}/{len(questions)}] 문제 {q.number} 풀이 중...")
-        try:
-            code = solve_question(q.body, model=args.model)
-            solved.append(SolvedQuestion(
-                number=q.number,
-                title=q.title,
-                body=q.body,
-                code=code,
-            ))
-            print(f"  [{i}/{len(questions)}] 문제 {q.number} 완료 ({len(code)}자)")
-        except Exception as e:
-            print(f"  경고: 문제 {q.number} 풀이 실패 - {e}", file=sys.stderr)
-            solved.append(SolvedQuestion(
-                number=q.number,
-                title=q.title,
-                body=q.body,
-                code=f"# 풀이 생성 실패: {e}",
+    logger.info(f"[3/{total_steps}] GPT ({args.model})로 풀이를 생성합니다...")
+    # 번호만 다르고 내용이 같은 문항은 한 번만 요청하고 결과를 나누어 쓴다
+    unique = {}
+    for q in questions:
+        unique.setdefault(q.content, q)
+    targets = list(unique.values())
+    bodies = [q.body for q in targets]
+    if len(targets) < len(questions):
+        logger.info(f"  번호 외에 내용이 같은 문항 {len(questions) - len(targets)}개는 한 번만 요청합니다")
+
+    try:
+        if args.batch:
+            flush_logs()
+            # 폴링이 최대 24시간 걸리므로 작업 확인/취소에 필요한 ID는 바로 출력한다
+            results = solve_questions_batch(
+                bodies,
+                model=args.model,
+                use_cache=not args.no_cache,
+                on_created=lambda batch_id: flush_logs(),
+            )
+        else:
+            # 문항별 요청을 동시에 보내고, 끝나는 순서대로 진행 상황을 출력
+            logger.info(f"  {len(targets)}개 문항을 동시에 요청합니다 (최대 {config.MAX_CONCURRENCY}개)")
+            flush_logs()
+            done = 0
+
+            def report(index: int, result: str | Exception) -> None:
+                nonlocal done
+                done += 1
+                q = targets[index]
+                if isinstance(result, Exception):
+                    logger.info(f"  [{done}/{len(targets)}] 문제 {q.number} 실패")
+                else:
+                    logger.info(f"  [{done}/{len(targets)}] 문제 {q.number} 완료 ({len(result)}자)")
+                # 문항 결과는 API 응답 간격으로 드문드문 오므로 바로 출력한다
+                flush_logs()
+
+            results = asyncio.run(solve_many(
+                bodies,
+                model=args.model,
+                use_cache=not args.no_cache,
+                group_size=args.group_size,
+                on_result=None if args.quiet else report,
             ))
+    except Exception as e:
+        # 결과를 하나도 얻기 전에 실패한 경우. API 키 누락 등은 풀이 함수가
+        # 캐시에 없던 문항의 결과로 돌려주므로, 캐시된 풀이는 여기서 버려지지 않는다
+        results = [e] * len(targets)
+
+    results_by_content = dict(zip(unique, results))
+    solved = []
+    for q in questions:
+        result = results_by_content[q.content]
+        if isinstance(result, BaseException):
+            logger.warning(f"  경고: 문제 {q.number} 풀이 실패 - {result}")
+            code = f"# 풀이 생성 실패: {result}"
+        else:
+            code = result
+        solved.append(SolvedQuestion(
+            number=q.number,
+            title=q.title,
+            body=q.body,
+            code=code,
+        ))
 
     # ── 4단계: 노트북 생성 ──
-    print(f"[4/{total_steps}] Jupyter Notebook을 생성합니다...")
+    logger.info(f"[4/{total_steps}] Jupyter Notebook을 생성합니다...")
     title = f"{input_path.stem} - 풀이"
     build_notebook(solved, title=title, output_path=output_path)
-    print(f"  저장 완료: {output_path}")
-    print(f"\n완료! {len(solved)}개 문항의 풀이가 생성되었습니다.")
+    logger.info(f"  저장 완료: {output_path}")
+    logger.info(f"\n완료! {len(solved)}개 문항의 풀이가 생성되었습니다.")
+    flush_logs()
+
+
+def main():
+    args = parse_args()
+    setup_logging()
+
+    input_paths = [Path(p) for p in args.input]
+    for input_path in input_paths:
+        if not input_path.exists():
+            logger.error(f"오류: 파일을 찾을 수 없습니다: {input_path}")
+            sys.exit(1)
+
+    if args.output and len(input_paths) > 1:
+        logger.error("오류: -o 옵션은 입력 파일이 하나일 때만 사용할 수 있습니다")
+        sys.exit(1)
+
+    # 파일명이 같은 입력(a/x.docx, b/x.docx)이 같은 노트북을 덮어쓰지 않도록 확인
+    output_paths = [output_path_for(args, p) for p in input_paths]
+    seen = {}
+    for input_path, output_path in zip(input_paths, output_paths):
+        key = output_path.resolve()
+        if key in seen and not args.dry_run:
+            logger.error(
+                f"오류: {seen[key]}와 {input_path}의 출력 경로가 같습니다: {output_path}"
+            )
+            sys.exit(1)
+        seen[key] = input_path
+
+    total_steps = 2 if args.dry_run else 4
+
+    # ── 1단계: 문서 추출 ──
+    logger.info(f"[1/{total_steps}] 문서에서 텍스트와 수식을 추출합니다...")
+    texts = extract_documents(input_paths)
+
+    failed = False
+    for input_path, output_path, full_text in zip(input_paths, output_paths, texts):
+        if len(input_paths) > 1:
+            logger.info(f"\n=== {input_path.name} ===")
+        if isinstance(full_text, Exception):
+            logger.error(f"오류: 문서 추출 실패 - {full_text}")
+            failed = True
+            continue
+
+        logger.info(f"  추출 완료: {len(full_text)}자")
+        process_document(args, input_path, output_path, full_text, total_steps)
+
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -3,14 +3,17 @@
 nbformat을 사용하여 문항과 풀이를 노트북으로 구성한다.
 """
 
+import os
 from pathlib import Path
 from dataclasses import dataclass
 
 import nbformat
-from nbformat.v4 import new_notebook, new_markdown_cell, new_code_cell
+import orjson
+from nbformat.corpus.words import generate_corpus_id
+from nbformat.v4 import new_notebook
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SolvedQuestion:
     """풀이가 포함된 문항."""
     number: int
@@ -31,10 +34,72 @@ plt.rcParams['axes.unicode_minus'] = False      # 마이너스 부호
 """
 
 
+# 노트북 커널 정보 (반환된 노트북을 수정해도 바뀌지 않도록 복사해서 사용)
+_KERNELSPEC = {
+    "display_name": "Python 3",
+    "language": "python",
+    "name": "python3",
+}
+_LANGUAGE_INFO = {
+    "name": "python",
+    "version": "3.10.0",
+}
+
+
+def _markdown_cell(source: str) -> nbformat.NotebookNode:
+    """마크다운 셀. new_markdown_cell과 같지만 셀마다 스키마 검증을 하지 않는다."""
+    return nbformat.NotebookNode(
+        id=generate_corpus_id(),
+        cell_type="markdown",
+        metadata=nbformat.NotebookNode(),
+        source=source,
+    )
+
+
+def _code_cell(source: str) -> nbformat.NotebookNode:
+    """코드 셀. new_code_cell과 같지만 셀마다 스키마 검증을 하지 않는다."""
+    return nbformat.NotebookNode(
+        id=generate_corpus_id(),
+        cell_type="code",
+        metadata=nbformat.NotebookNode(),
+        execution_count=None,
+        source=source,
+        outputs=[],
+    )
+
+
+def _write_notebook(nb: nbformat.NotebookNode, path: Path) -> None:
+    """검증된 노트북을 JSON 파일로 쓴다.
+
+    nbformat.write는 노트북 전체를 깊은 복사한 뒤 순수 파이썬 json으로
+    직렬화하므로, 셀 source만 줄 단위 리스트로 바꾼 얕은 복사본을 orjson으로
+    직렬화한다. orjson은 들여쓰기 2칸만 지원하는 것 외에는 nbformat과 같은
+    형식(키 정렬, 비ASCII 문자 그대로)으로 쓴다.
+
+    임시 파일에 다 쓴 뒤 교체하므로, 저장 중에 중단되어도 기존 파일이
+    반쯤 쓰인 상태로 남지 않는다.
+    """
+    data = dict(nb)
+    data["cells"] = [
+        {**cell, "source": cell.source.splitlines(True)} for cell in nb.cells
+    ]
+    content = orjson.dumps(
+        data,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+    )
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def build_notebook(
     solved_questions: list[SolvedQuestion],
     title: str = "데이터분석 실기 풀이",
-    output_path: str | None = None,
+    output_path: str | os.PathLike | None = None,
 ) -> nbformat.NotebookNode:
     """문항과 풀이를 Jupyter Notebook으로 생성한다.
 
@@ -51,37 +116,35 @@ def build_notebook(
     nb = new_notebook()
 
     # 커널 정보 설정
-    nb.metadata.kernelspec = {
-        "display_name": "Python 3",
-        "language": "python",
-        "name": "python3",
-    }
-    nb.metadata.language_info = {
-        "name": "python",
-        "version": "3.10.0",
-    }
-
-    # 제목 셀
-    nb.cells.append(new_markdown_cell(f"# {title}"))
-
-    # 공통 import 셀
-    nb.cells.append(new_code_cell(COMMON_IMPORTS))
+    nb.metadata.kernelspec = dict(_KERNELSPEC)
+    nb.metadata.language_info = dict(_LANGUAGE_INFO)
+
+    # 셀은 지역 리스트에 모은 뒤 한 번에 지정한다
+    # (nb.cells는 접근할 때마다 NotebookNode.__getattr__를 거친다)
+    cells = [
+        _markdown_cell(f"# {title}"),   # 제목 셀
+        _code_cell(COMMON_IMPORTS),     # 공통 import 셀
+    ]
 
     # 문항별 셀
     for q in solved_questions:
         # 문항 마크다운 셀
         md_content = f"## 문제 {q.number}\n\n{q.body}"
-        nb.cells.append(new_markdown_cell(md_content))
+        cells.append(_markdown_cell(md_content))
 
         # 풀이 코드 셀
         if q.code:
-            nb.cells.append(new_code_cell(q.code))
+            cells.append(_code_cell(q.code))
+
+    nb.cells = cells
+
+    # 셀 단위 검증 대신 완성된 노트북을 한 번만 검증
+    nbformat.validate(nb)
 
     # 파일 저장
     if output_path:
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            nbformat.write(nb, f)
+        _write_notebook(nb, path)
 
     return nb